@@ -1,8 +1,7 @@
-import requests
-from requests.exceptions import HTTPError
+from requests.exceptions import HTTPError, RequestException
 
 from config import API_URL          
-from utils import get_secure_input 
+from utils import get_secure_input, secrets_match, session 
 
 def account_settings_menu(username, master_password):
     while True:
@@ -21,7 +20,7 @@ def account_settings_menu(username, master_password):
             if new_password is None:
                 continue
             confirm_password = get_secure_input("Confirm new master password:", is_password=True)
-            if confirm_password is None or new_password != confirm_password:
+            if confirm_password is None or not secrets_match(new_password, confirm_password):
                 print("Passwords don't match!")
                 continue
 
@@ -31,13 +30,13 @@ def account_settings_menu(username, master_password):
                 "new_master_password": new_password
             }
             try:
-                resp = requests.post(f"{API_URL}/reset_master_password", json=payload)
+                resp = session.post(f"{API_URL}/reset_master_password", json=payload)
                 resp.raise_for_status()
                 print(resp.json())
                 master_password = new_password
             except HTTPError:
                 print("Error resetting password.")
-            except Exception as e:
+            except RequestException as e:
                 print(f"Error resetting password: {e}") 
 
         elif choice == '2':
@@ -51,14 +50,14 @@ def account_settings_menu(username, master_password):
                 if sub_choice == '1':
                     payload = {"username": username}
                     try:
-                        resp = requests.post(f"{API_URL}/enable_2fa", json=payload)
+                        resp = session.post(f"{API_URL}/enable_2fa", json=payload)
                         resp.raise_for_status()
                         data = resp.json()
                         print("2FA enabled. Secret:", data.get("totp_secret"))
                         print("Provisioning URI:", data.get("provisioning_uri"))
                     except HTTPError:
                         print("Error enabling 2FA.")
-                    except Exception as e:
+                    except RequestException as e:
                         print(f"Error enabling 2FA: {e}")
 
                 elif sub_choice == '2':
@@ -70,12 +69,12 @@ def account_settings_menu(username, master_password):
                         "pin": pin
                     }
                     try:
-                        resp = requests.post(f"{API_URL}/disable_2fa", json=payload)
+                        resp = session.post(f"{API_URL}/disable_2fa", json=payload)
                         resp.raise_for_status()
                         print(resp.json())
                     except HTTPError:
                         print("Error disabling 2FA: invalid recovery PIN.")
-                    except Exception as e:
+                    except RequestException as e:
                         print(f"Error disabling 2FA: {e}")
                 
                 elif sub_choice == '3':
@@ -87,15 +86,15 @@ def account_settings_menu(username, master_password):
                 continue
             payload = {"username": username, "pin": pin}
             try:
-                resp = requests.post(f"{API_URL}/delete_all_data", json=payload)
+                resp = session.post(f"{API_URL}/delete_all_data", json=payload)
                 resp.raise_for_status()
                 print(resp.json())
             except HTTPError:
                 print("Error deleting all data.")
-            except Exception as e:
+            except RequestException as e:
                 print(f"Error deleting all data: {e}")
 
         elif choice == '4':
-            break
+            return master_password
         else:
             print("Invalid choice. Try again.")
\ No newline at end of file
@@ -1,8 +1,7 @@
-import requests
-from requests.exceptions import HTTPError
+from requests.exceptions import HTTPError, RequestException
 
 from config import API_URL          # from config
-from utils import get_secure_input  # get_secure_input from utils
+from utils import get_secure_input, secrets_match, session  # get_secure_input from utils
 
 
 def register_account():
@@ -17,7 +16,7 @@ def register_account():
     confirm_master_password = get_secure_input("Confirm master password:", is_password=True)
     if confirm_master_password is None:
         return
-    if master_password != confirm_master_password:
+    if not secrets_match(master_password, confirm_master_password):
         print("Passwords don't match!")
         return
     recovery_pin = get_secure_input("Enter 6-digit recovery PIN:", is_password=True)
@@ -29,7 +28,7 @@ def register_account():
     confirm_pin = get_secure_input("Confirm recovery PIN:", is_password=True)
     if confirm_pin is None:
         return
-    if recovery_pin != confirm_pin:
+    if not secrets_match(recovery_pin, confirm_pin):
         print("PINs don't match!")
         return
 
@@ -41,12 +40,12 @@ def register_account():
         "confirm_recovery_pin": confirm_pin
     }
     try:
-        response = requests.post(f"{API_URL}/register", json=payload)
+        response = session.post(f"{API_URL}/register", json=payload)
         response.raise_for_status()
         print(response.json())
     except HTTPError:
         print("Registration failed: please check your inputs or try again later.")
-    except Exception as e:
+    except RequestException as e:
         print(f"Registration error: {e}")
 
 def login():
@@ -69,8 +68,8 @@ def login():
 
     while True:
         try:
-            resp = requests.post(f"{API_URL}/login", json=payload)
-        except Exception as e:
+            resp = session.post(f"{API_URL}/login", json=payload)
+        except RequestException as e:
             print(f"Login error: {e}")
             return None, None
 
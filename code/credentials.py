@@ -1,8 +1,7 @@
-import requests
-from requests.exceptions import HTTPError
+from requests.exceptions import HTTPError, RequestException
 
 from config import API_URL          
-from utils import get_secure_input 
+from utils import get_secure_input, session 
 
 def credentials_menu(username, master_password):
     while True:
@@ -33,12 +32,12 @@ def credentials_menu(username, master_password):
                 "s_password": s_password
             }
             try:
-                resp = requests.post(f"{API_URL}/add_credentials", json=payload)
+                resp = session.post(f"{API_URL}/add_credentials", json=payload)
                 resp.raise_for_status()
                 print(resp.json())
             except HTTPError:
                 print("Error adding credentials.")
-            except Exception as e:
+            except RequestException as e:
                 print(f"Error adding credentials: {e}")
 
         elif choice == '2':
@@ -52,24 +51,24 @@ def credentials_menu(username, master_password):
                 "site": site
             }
             try:
-                resp = requests.post(f"{API_URL}/get_credentials", json=payload)
+                resp = session.post(f"{API_URL}/get_credentials", json=payload)
                 resp.raise_for_status()
                 print(resp.json())
             except HTTPError:
                 print("Error retrieving credentials.")
-            except Exception as e:
+            except RequestException as e:
                 print(f"Error retrieving credentials: {e}")
 
         elif choice == '3':
             try:
-                resp = requests.post(f"{API_URL}/get_all_sites", json={"username": username})
+                resp = session.post(f"{API_URL}/get_all_sites", json={"username": username})
                 resp.raise_for_status()
                 print("Stored Sites:")
                 for s in resp.json().get("sites", []):
                     print(" -", s)
             except HTTPError:
                 print("Error listing sites.")
-            except Exception as e:
+            except RequestException as e:
                 print(f"Error listing sites: {e}") 
 
         elif choice == '4':          
@@ -85,12 +84,12 @@ def credentials_menu(username, master_password):
                 "pin": pin
             }
             try:
-                resp = requests.post(f"{API_URL}/delete_credentials", json=payload)
+                resp = session.post(f"{API_URL}/delete_credentials", json=payload)
                 resp.raise_for_status()
                 print(resp.json())
             except HTTPError:
                 print("Error deleting credentials: invalid PIN.")
-            except Exception as e:
+            except RequestException as e:
                 print(f"Error deleting credentials: {e}")
 
         elif choice == '5':
@@ -1,8 +1,7 @@
-import requests
-from requests.exceptions import HTTPError
+from requests.exceptions import HTTPError, RequestException
 
 from config import API_URL          
-from utils import get_secure_input 
+from utils import get_secure_input, session 
 
 def documents_menu(username, master_password):
     while True:
@@ -30,12 +29,12 @@ def documents_menu(username, master_password):
                 "doc_contents": doc_contents
             }
             try:
-                resp = requests.post(f"{API_URL}/add_secure_doc", json=payload)
+                resp = session.post(f"{API_URL}/add_secure_doc", json=payload)
                 resp.raise_for_status()
                 print(resp.json())
             except HTTPError:
                 print("Error adding document.")
-            except Exception as e:
+            except RequestException as e:
                 print(f"Error adding document: {e}")
 
         elif choice == '2':
@@ -49,24 +48,24 @@ def documents_menu(username, master_password):
                 "doc_name": doc_name
             }
             try:
-                resp = requests.post(f"{API_URL}/get_secure_doc", json=payload)
+                resp = session.post(f"{API_URL}/get_secure_doc", json=payload)
                 resp.raise_for_status()
                 print(resp.json())
             except HTTPError:
                 print("Error viewing document.")
-            except Exception as e:
+            except RequestException as e:
                 print(f"Error viewing document: {e}")
 
         elif choice == '3':
             try:
-                resp = requests.get(f"{API_URL}/get_all_docs", params={"username": username})
+                resp = session.get(f"{API_URL}/get_all_docs", params={"username": username})
                 resp.raise_for_status()
                 print("Stored Documents:")
                 for d in resp.json().get("documents", []):
                     print(" -", d)
             except HTTPError:
                 print("Error listing documents.")
-            except Exception as e:
+            except RequestException as e:
                 print(f"Error listing documents: {e}")
 
         elif choice == '4':
@@ -84,12 +83,12 @@ def documents_menu(username, master_password):
                 "new_contents": new_contents
             }
             try:
-                resp = requests.post(f"{API_URL}/update_secure_doc", json=payload)
+                resp = session.post(f"{API_URL}/update_secure_doc", json=payload)
                 resp.raise_for_status()
                 print(resp.json())
             except HTTPError:
                 print("Error updating document.")
-            except Exception as e:
+            except RequestException as e:
                 print(f"Error updating document: {e}")
 
         elif choice == '5':          
@@ -105,12 +104,12 @@ def documents_menu(username, master_password):
                 "pin": pin
             }
             try:
-                resp = requests.post(f"{API_URL}/delete_secure_doc", json=payload)
+                resp = session.post(f"{API_URL}/delete_secure_doc", json=payload)
                 resp.raise_for_status()
                 print(resp.json())
             except HTTPError:
                 print("Error deleting document: invalid PIN.")
-            except Exception as e:
+            except RequestException as e:
                 print(f"Error deleting document: {e}")
 
         elif choice == '6':
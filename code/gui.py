@@ -1,11 +1,25 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 import threading
+import hmac
 import requests
 
 # API endpoint
 API_URL = "https://secure-asf-password-manager.onrender.com"
 
+# every API call runs on its own worker thread; requests.Session is not
+# guaranteed thread-safe, so they share one session behind a lock
+session = requests.Session()
+_session_lock = threading.Lock()
+
+def _post(url, **kwargs):
+    with _session_lock:
+        return session.post(url, **kwargs)
+
+def _secrets_match(a, b):
+    # constant-time comparison for password/PIN confirmation fields
+    return hmac.compare_digest(a.encode('utf-8'), b.encode('utf-8'))
+
 class SecureASFApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -86,9 +100,9 @@ class RegisterFrame(ttk.Frame):
             pin_conf = self.pin_confirm_var.get()
             if not (user and pw and pw_conf and pin and pin_conf):
                 messagebox.showerror("Error", "All fields are required.")
-            elif pw != pw_conf:
+            elif not _secrets_match(pw, pw_conf):
                 messagebox.showerror("Error", "Passwords do not match.")
-            elif pin != pin_conf or not pin.isdigit() or len(pin) != 6:
+            elif not _secrets_match(pin, pin_conf) or not pin.isdigit() or len(pin) != 6:
                 messagebox.showerror("Error", "PINs must match and be 6 digits.")
             else:
                 payload = {
@@ -99,9 +113,11 @@ class RegisterFrame(ttk.Frame):
                     "confirm_recovery_pin": pin_conf
                 }
                 try:
-                    resp = requests.post(f"{API_URL}/register", json=payload)
+                    resp = _post(f"{API_URL}/register", json=payload)
                     resp.raise_for_status()
                     messagebox.showinfo("Success", resp.json().get('message', 'Registered successfully.'))
+                    for var in (self.pw_var, self.pw_confirm_var, self.pin_var, self.pin_confirm_var):
+                        var.set('')
                     self.controller.show_frame(MainMenu)
                 except Exception as e:
                     messagebox.showerror("Registration Failed", str(e))
@@ -136,10 +152,11 @@ class LoginFrame(ttk.Frame):
             else:
                 payload = {"username": user, "master_password": pw}
                 try:
-                    resp = requests.post(f"{API_URL}/login", json=payload)
+                    resp = _post(f"{API_URL}/login", json=payload)
                     if resp.status_code == 200 and resp.json().get('message','').lower().startswith('login successful'):
                         self.controller.username = user
                         self.controller.master_password = pw
+                        self.pw_var.set('')
                         messagebox.showinfo("Success", "Login successful.")
                         self.controller.show_frame(UserMenuFrame)
                     else:
@@ -183,14 +200,16 @@ class RecoverFrame(ttk.Frame):
             new_conf = self.new_pw_conf_var.get()
             if not (user and pin and new_pw and new_conf):
                 messagebox.showerror("Error", "All fields are required.")
-            elif new_pw != new_conf:
+            elif not _secrets_match(new_pw, new_conf):
                 messagebox.showerror("Error", "Passwords do not match.")
             else:
                 payload = {"username": user, "recovery_pin": pin, "new_master_password": new_pw}
                 try:
-                    resp = requests.post(f"{API_URL}/reset_master_password", json=payload)
+                    resp = _post(f"{API_URL}/reset_master_password", json=payload)
                     resp.raise_for_status()
                     messagebox.showinfo("Success", resp.json().get('message', 'Password reset successful.'))
+                    for var in (self.pin_var, self.new_pw_var, self.new_pw_conf_var):
+                        var.set('')
                     self.controller.show_frame(MainMenu)
                 except Exception as e:
                     messagebox.showerror("Recovery Failed", str(e))
@@ -284,7 +303,7 @@ class WalletFrame(ttk.Frame):
     def _api_call(self, path, payload):
         def task():
             try:
-                resp = requests.post(f"{API_URL}{path}", json=payload)
+                resp = _post(f"{API_URL}{path}", json=payload)
                 resp.raise_for_status()
                 messagebox.showinfo("Success", resp.json())
             except Exception as e:
@@ -428,14 +447,14 @@ class AccountSettingsFrame(ttk.Frame):
         new = simpledialog.askstring("New Password", "Enter new master password:", show='*')
         if new is None: return
         conf = simpledialog.askstring("Confirm Password", "Confirm new master password:", show='*')
-        if conf != new:
+        if conf is None or not _secrets_match(conf, new):
             messagebox.showerror("Error", "Passwords don't match!")
             return
         self._api_call('/reset_master_password', {
             'username': self.controller.username,
             'old_master_password': old,
             'new_master_password': new
-        })
+        }, on_success=lambda: setattr(self.controller, 'master_password', new))
 
     def enable_2fa(self):
         self._api_call('/enable_2fa', {'username': self.controller.username})
@@ -451,11 +470,13 @@ class AccountSettingsFrame(ttk.Frame):
         if messagebox.askyesno("Confirm", "Are you sure? This will delete ALL your data."):
             self._api_call('/delete_all_data', {'username': self.controller.username, 'pin': pin})
 
-    def _api_call(self, path, payload):
+    def _api_call(self, path, payload, on_success=None):
         def task():
             try:
-                resp = requests.post(f"{API_URL}{path}", json=payload)
+                resp = _post(f"{API_URL}{path}", json=payload)
                 resp.raise_for_status()
+                if on_success:
+                    on_success()
                 messagebox.showinfo("Success", resp.json())
             except Exception as e:
                 messagebox.showerror("Error", str(e))
@@ -463,4 +484,7 @@ class AccountSettingsFrame(ttk.Frame):
 
 if __name__ == '__main__':
     app = SecureASFApp()
-    app.mainloop()
+    try:
+        app.mainloop()
+    finally:
+        session.close()
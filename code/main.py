@@ -1,8 +1,19 @@
+import sys
+import traceback
+
 from auth import login, register_account
 from wallets import wallet_menu
 from credentials import credentials_menu
 from documents import documents_menu
 from account_settings import account_settings_menu
+from utils import session
+
+# user menu choices that open a vault submenu
+VAULT_MENUS = {
+    '1': wallet_menu,
+    '2': credentials_menu,
+    '3': documents_menu,
+}
 
 def main_menu():
     while True:
@@ -33,14 +44,11 @@ def user_menu(username, master_password):
         print("5. Logout")
         choice = input("Enter your choice: ")
 
-        if choice == '1':
-            wallet_menu(username, master_password)
-        elif choice == '2':
-            credentials_menu(username, master_password)
-        elif choice == '3':
-            documents_menu(username, master_password)
+        vault_menu = VAULT_MENUS.get(choice)
+        if vault_menu:
+            vault_menu(username, master_password)
         elif choice == '4':
-            account_settings_menu(username, master_password)
+            master_password = account_settings_menu(username, master_password)
         elif choice == '5':
             print("Logging out...")
             break
@@ -48,6 +56,12 @@ def user_menu(username, master_password):
             print("Invalid choice. Try again.")
 
 if __name__ == "__main__":
-    main_menu()
+    try:
+        main_menu()
+    except Exception:
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        session.close()
 
 
@@ -1,4 +1,10 @@
 import getpass
+import hmac
+
+import requests
+
+# shared session so every API call reuses the same keep-alive connection
+session = requests.Session()
 
 def get_secure_input(prompt, is_password=False):
     while True:
@@ -9,4 +15,8 @@ def get_secure_input(prompt, is_password=False):
         if user_input.lower() == 'esc':
             return None
         if user_input:
-            return user_input
\ No newline at end of file
+            return user_input
+
+def secrets_match(a, b):
+    # constant-time comparison for password/PIN confirmation prompts
+    return hmac.compare_digest(a.encode('utf-8'), b.encode('utf-8'))
@@ -1,8 +1,7 @@
-import requests
-from requests.exceptions import HTTPError
+from requests.exceptions import HTTPError, RequestException
 
 from config import API_URL          
-from utils import get_secure_input 
+from utils import get_secure_input, session 
 
 def wallet_menu(username, master_password):
     while True:
@@ -41,12 +40,12 @@ def wallet_menu(username, master_password):
                 "pin": pin
             }
             try:
-                resp = requests.post(f"{API_URL}/add_wallet", json=payload)
+                resp = session.post(f"{API_URL}/add_wallet", json=payload)
                 resp.raise_for_status()
                 print(resp.json())
             except HTTPError:
                 print("Error adding wallet: check your inputs.")
-            except Exception as e:
+            except RequestException as e:
                 print(f"Error adding wallet: {e}")
 
         elif choice == '2':
@@ -64,24 +63,24 @@ def wallet_menu(username, master_password):
                 "pin": pin
             }
             try:
-                resp = requests.post(f"{API_URL}/get_wallet", json=payload)
+                resp = session.post(f"{API_URL}/get_wallet", json=payload)
                 resp.raise_for_status()
                 print(resp.json())
             except HTTPError:
                 print("Error retrieving wallet: invalid credentials or PIN.")
-            except Exception as e:
+            except RequestException as e:
                 print(f"Error retrieving wallet: {e}")
 
         elif choice == '3':
             try:
-                resp = requests.post(f"{API_URL}/get_all_wallets", json={"username": username})
+                resp = session.post(f"{API_URL}/get_all_wallets", json={"username": username})
                 resp.raise_for_status()
                 print("Stored Wallets:")
                 for w in resp.json().get("wallets", []):
                     print(" -", w)
             except HTTPError:
                 print("Error listing wallets.")
-            except Exception as e:
+            except RequestException as e:
                 print(f"Error listing wallets: {e}")
 
         elif choice == '4':            
@@ -97,12 +96,12 @@ def wallet_menu(username, master_password):
                 "pin": pin
             }
             try:
-                resp = requests.post(f"{API_URL}/delete_wallet", json=payload)
+                resp = session.post(f"{API_URL}/delete_wallet", json=payload)
                 resp.raise_for_status()
                 print(resp.json())
             except HTTPError:
                 print("Error deleting wallet: invalid PIN.")
-            except Exception as e:
+            except RequestException as e:
                 print(f"Error deleting wallet: {e}")
 
         elif choice == '5':